@@ -33,6 +33,9 @@ from interview_analysis.yaml_io import read_yaml_mapping
 
 ANALYSIS_OUTPUT_VERSION = 6
 
+# Upper bound for concurrent LLM requests within one segment (per-topic strategy).
+_MAX_CONCURRENT_LLM_CALLS = 8
+
 
 @dataclass(frozen=True)
 class AnalyzeAction:
@@ -673,6 +676,30 @@ class AnalyzeAction:
 
         return result
 
+    async def _call_llm_json_many(self, *, system: str, user_payloads: list[dict[str, Any]]) -> list[Any]:
+        """
+        Run several `_call_llm_json()` requests concurrently.
+
+        At most `_MAX_CONCURRENT_LLM_CALLS` requests are in flight at a time.
+
+        Args:
+            system:
+                System prompt shared by all requests.
+            user_payloads:
+                One user payload per request.
+
+        Returns:
+            Parsed JSON responses in the order of `user_payloads`.
+        """
+
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_LLM_CALLS)
+
+        async def _one(user_payload: dict[str, Any]) -> Any:
+            async with limit:
+                return await self._call_llm_json(system=system, user_payload=user_payload)
+
+        return list(await asyncio.gather(*(_one(p) for p in user_payloads)))
+
     async def _code_segment_full_codebook(
         self,
         *,
@@ -993,6 +1020,10 @@ class AnalyzeAction:
             extra_instructions=extra,
         )
 
+        # Build all per-topic requests first, then run them concurrently. The
+        # results are processed in codebook order, so the output stays stable.
+        topic_requests: list[tuple[str, dict[str, Any]]] = []
+
         for topic in topics:
             if not isinstance(topic, dict):
                 continue
@@ -1007,7 +1038,6 @@ class AnalyzeAction:
             orientations_clean = [o.strip() for o in orientations if isinstance(o, str) and o.strip()]
             allowed_orientations[topic_name] = orientations_clean
 
-            print(f"    * Topic: {topic_name}")
             explain_assignments = bool(llm_guidance.get("explain_assignments", False))
             list_rejected = bool(llm_guidance.get("list_rejected_assignments", False))
             conservative_orientation = bool(llm_guidance.get("default_to_conservative_orientation", True))
@@ -1097,8 +1127,15 @@ class AnalyzeAction:
                 },
             }
 
-            result = await self._call_llm_json(system=system, user_payload=user_payload)
+            topic_requests.append((topic_name, user_payload))
+
+        results = await self._call_llm_json_many(
+            system=system,
+            user_payloads=[payload for _name, payload in topic_requests],
+        )
 
+        for (topic_name, _payload), result in zip(topic_requests, results):
+            print(f"    * Topic: {topic_name}")
             if not isinstance(result, dict):
                 errors.append(f"{topic_name}: LLM returned non-object JSON")
                 continue
@@ -1239,7 +1276,7 @@ class AnalyzeAction:
 
         return combined, errors, warnings
 
-    def _build_orientation_policy(self, topics: list[Any]) -> dict[str, dict[str, Any]]:
+    def _build_orientation_policy(self, topics: tuple[Any, ...]) -> dict[str, dict[str, Any]]:
         """Build per-topic policy for orientation assignment.
 
         Returns a mapping:
@@ -1260,7 +1297,7 @@ class AnalyzeAction:
             rank: dict[str, int] = {}
 
             orientations = getattr(t, "orientations", None)
-            if isinstance(orientations, list):
+            if isinstance(orientations, tuple):
                 labels: list[str] = []
                 for o in orientations:
                     label = getattr(o, "label", None)
@@ -17,7 +17,6 @@ as reference-only so downstream coding can ignore it when counting frequency.
 """
 
 import argparse
-import fnmatch
 import glob
 import hashlib
 import re
@@ -28,8 +27,8 @@ from typing import Any
 
 import yaml
 
-from interview_analysis.config import ConfigError, InterviewConfig
-from interview_analysis.hash_utils import md5_file
+from interview_analysis.config import ConfigError, InterviewConfig, normalize_glob_pattern
+from interview_analysis.hash_utils import md5_files
 from interview_analysis.transcripts.registry import TRANSCRIPT_PARSING_VERSION, read_transcript_paragraphs
 from interview_analysis.yaml_io import read_yaml_mapping
 
@@ -113,6 +112,9 @@ class SegmentAction:
             "documents": [],
         }
 
+        # Hash all transcripts up front; the pool overlaps file reads.
+        transcript_md5s = md5_files(input_files)
+
         updated = 0
         skipped = 0
         failed = 0
@@ -120,6 +122,7 @@ class SegmentAction:
             doc_record, did_update = self._segment_one_file(
                 config=config,
                 input_path=input_path,
+                transcript_md5=transcript_md5s[input_path],
                 out_dir=out_dir,
                 segment_paragraphs=segment_paragraphs,
                 overlap_paragraphs=overlap_paragraphs,
@@ -164,22 +167,14 @@ class SegmentAction:
         include_patterns = config.include
         paths: list[Path] = []
         for pat in include_patterns:
-            include = self._normalize_glob_pattern(pat)
+            include = normalize_glob_pattern(pat)
             include_glob = str((base_dir / include).as_posix())
             matches = glob.glob(include_glob, recursive=True)
             paths.extend(Path(p) for p in matches)
 
-        exclude_patterns = config.exclude or []
-        if exclude_patterns:
-            exclude_norms = [self._normalize_glob_pattern(p) for p in exclude_patterns]
-            paths = [
-                p
-                for p in paths
-                if not any(
-                    fnmatch.fnmatch(self._rel_posix(base_dir, p), ex)
-                    for ex in exclude_norms
-                )
-            ]
+        exclude_match = config.exclude_re.match if config.exclude_re is not None else None
+        if exclude_match is not None:
+            paths = [p for p in paths if not exclude_match(self._rel_posix(base_dir, p))]
 
         paths = [p for p in paths if p.is_file()]
         return sorted({p.resolve() for p in paths})
@@ -189,6 +184,7 @@ class SegmentAction:
         *,
         config: InterviewConfig,
         input_path: Path,
+        transcript_md5: str,
         out_dir: Path,
         segment_paragraphs: int,
         overlap_paragraphs: int,
@@ -201,6 +197,8 @@ class SegmentAction:
                 Loaded configuration.
             input_path:
                 Path to the transcript (ODT).
+            transcript_md5:
+                MD5 digest of the transcript file.
             out_dir:
                 Output directory inside the workdir.
             segment_paragraphs:
@@ -216,7 +214,6 @@ class SegmentAction:
         rel_path = self._rel_posix(config.base_dir, input_path)
         out_path = out_dir / f"{doc_id}.yaml"
 
-        transcript_md5 = md5_file(input_path)
         if out_path.exists():
             existing = read_yaml_mapping(out_path)
             if self._segments_up_to_date(
@@ -516,29 +513,6 @@ class SegmentAction:
         safe = safe.strip("_") or "document"
         return f"{safe}-{digest}"
 
-    def _normalize_glob_pattern(self, pattern: str) -> str:
-        """
-        Normalize user-provided glob patterns to Python's recursive glob syntax.
-
-        The sample config uses `**.odt`, which is not a standard recursive glob
-        segment. This function converts patterns like `**.odt` to `**/*.odt`.
-
-        Args:
-            pattern:
-                Raw pattern from config.
-
-        Returns:
-            A pattern suitable for `glob.glob(..., recursive=True)`.
-        """
-
-        p = pattern.strip()
-        if p.startswith("**.") and "/" not in p:
-            ext = p[3:]
-            return f"**/*.{ext}"
-        if p == "**" or p == "**/":
-            return "**/*"
-        return p
-
     def _rel_posix(self, base_dir: Path, path: Path) -> str:
         """
         Compute a stable POSIX-style relative path.
@@ -18,10 +18,13 @@ The output contains:
 """
 
 import argparse
+import functools
 import re
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any, cast
+from xml.sax.saxutils import escape, quoteattr
 
 from odfdo import Document
 from odfdo.cell import Cell
@@ -47,6 +50,25 @@ _XML_ILLEGAL_CHARS_RE = re.compile(
     r"|[\uFFFE\uFFFF]"
 )
 
+# Assignment `kind` values that mark a secondary (not counted) topic.
+_SECONDARY_KINDS = frozenset({"secondary", "minor", "s"})
+
+# Characters replaced in sheet names (line breaks, path separators).
+_SHEET_NAME_TABLE = str.maketrans({"\n": " ", "\r": " ", "/": "_", "\\": "_"})
+
+# Pretty-print pattern for internal paragraph references: `<stem>-<10hex>:p0001`.
+_INTERNAL_PARA_REF = r"\b[A-Za-z0-9_-]+-[0-9a-f]{10}:(?P<ref>p\d{4}(?:-p\d{4})?)\b"
+
+# Hash suffix of internal document ids: `<stem>-<10hex>`.
+_DOC_ID_HASH_SUFFIX_RE = re.compile(r"-[0-9a-f]{10}$")
+
+# Characters not allowed in generated style names.
+_STYLE_NAME_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_]")
+
+# Extra entities for serialized cell text. A literal CR would be normalized to
+# LF when the fragment is parsed again.
+_XML_TEXT_ENTITIES = {"\r": "&#13;"}
+
 
 def _xml_safe_text(value: Any) -> str:
     """Return a string that is safe to embed in XML/ODS.
@@ -67,12 +89,150 @@ def _xml_safe_text(value: Any) -> str:
     else:
         text = str(value)
 
-    if not text:
-        return ""
+    # Fast path: every character matched by the pattern below is non-printable,
+    # so printable strings (most labels, ids and single-line quotes) are safe.
+    if not text or text.isprintable():
+        return text
 
     return _XML_ILLEGAL_CHARS_RE.sub("", text)
 
 
+def _string_cell_xml(text: str) -> str:
+    """Serialize text as a plain string `table:table-cell` element.
+
+    The text must already be XML-safe (see `_xml_safe_text`).
+    """
+
+    text = escape(text, _XML_TEXT_ENTITIES)
+    return f'<table:table-cell office:value-type="string"><text:p>{text}</text:p></table:table-cell>'
+
+
+def _empty_cells_xml(count: int) -> str:
+    """Serialize a run of empty cells as a single repeated `table:table-cell`."""
+
+    if count == 1:
+        return "<table:table-cell/>"
+    return f'<table:table-cell table:number-columns-repeated="{count}"/>'
+
+
+def _serialize_transcript_rows(rows: Any, keys: tuple[str, ...]) -> tuple[list[int], list[str]]:
+    """Serialize the data rows of one transcript sheet.
+
+    Args:
+        rows:
+            Row dicts of the sheet. Anything else is ignored.
+        keys:
+            Row keys in column order.
+
+    Returns:
+        The longest value per column (in characters) and the serialized
+        `table:table-row` elements.
+    """
+
+    widths = [0] * len(keys)
+    rows_xml: list[str] = []
+    if not isinstance(rows, list):
+        return widths, rows_xml
+
+    # Local aliases keep global lookups out of the per-cell loop.
+    safe_text = _xml_safe_text
+    cell_xml = _string_cell_xml
+    append_row = rows_xml.append
+    for r in rows:
+        if not isinstance(r, dict):
+            continue
+        get = r.get
+        cells: list[str] = []
+        empty_run = 0
+        for c_idx, key in enumerate(keys):
+            val = safe_text(get(key, ""))
+            if not val:
+                # Collapse runs of empty cells (e.g. the researcher columns)
+                # into one repeated cell.
+                empty_run += 1
+                continue
+            if empty_run:
+                cells.append(_empty_cells_xml(empty_run))
+                empty_run = 0
+            if len(val) > widths[c_idx]:
+                widths[c_idx] = len(val)
+            cells.append(cell_xml(val))
+        if empty_run:
+            cells.append(_empty_cells_xml(empty_run))
+        append_row("<table:table-row>" + "".join(cells) + "</table:table-row>")
+
+    return widths, rows_xml
+
+
+def _append_rows_xml(table: Table, rows_xml: list[str]) -> None:
+    """Parse pre-serialized `table:table-row` elements once and append them.
+
+    This avoids building a Row/Cell object per cell for large sheets.
+    """
+
+    if not rows_xml:
+        return
+    holder = Element.from_tag("<table:table>" + "".join(rows_xml) + "</table:table>")
+    table.extend(holder.children)
+
+
+def _append_header_row(table: Table, titles: list[str], style: Style | None) -> None:
+    """Append a header row as one pre-serialized `table:table-header-rows` group.
+
+    Keeping the row inside a header-rows element lets many spreadsheet viewers
+    treat it as the sheet header (helps freezing). Titles are XML-escaped but
+    otherwise taken as is.
+    """
+
+    style_attr = ""
+    if style is not None and style.name:
+        style_attr = f" table:style-name={quoteattr(style.name)}"
+
+    cells = "".join(
+        f'<table:table-cell{style_attr} office:value-type="string"><text:p>{escape(title)}</text:p></table:table-cell>'
+        for title in titles
+    )
+    table.append(
+        Element.from_tag(
+            f"<table:table-header-rows><table:table-row>{cells}</table:table-row></table:table-header-rows>"
+        )
+    )
+
+
+def _rejected_assignment_label(item: Any) -> str | None:
+    """Return the sanitized `topic (orientation)` label of a rejected assignment.
+
+    Returns None for entries without a topic.
+    """
+
+    if not isinstance(item, dict):
+        return None
+    topic = item.get("topic")
+    if not isinstance(topic, str) or not topic.strip():
+        return None
+
+    label = topic.strip()
+    orientation = item.get("orientation")
+    if isinstance(orientation, str) and orientation.strip():
+        label = f"{label} ({orientation.strip()})"
+    return _xml_safe_text(label)
+
+
+@functools.lru_cache(maxsize=256)
+def _where_found_re(doc_id: str) -> re.Pattern[str]:
+    """Return a pattern matching internal references in a single pass.
+
+    The first alternative is this document's exact `<doc_id>:` prefix. The
+    second one is any `<stem>-<10hex>:pNNNN` reference, which fixes cases where
+    the analysis file's `document_id` or the evidence ids are not perfectly
+    aligned.
+    """
+
+    if not doc_id:
+        return re.compile(_INTERNAL_PARA_REF)
+    return re.compile(f"{re.escape(doc_id)}:|{_INTERNAL_PARA_REF}")
+
+
 def _make_style_name(prefix: str, scope: str, *, suffix: str = "") -> str:
     """Return a stable, ODF-friendly style name.
 
@@ -80,11 +240,11 @@ def _make_style_name(prefix: str, scope: str, *, suffix: str = "") -> str:
     and deterministic.
     """
 
-    scope_key = re.sub(r"[^A-Za-z0-9_]", "_", scope or "")
+    scope_key = _STYLE_NAME_UNSAFE_RE.sub("_", scope or "")
     scope_key = scope_key.strip("_")[:40] or "x"
     digest = md5_text(scope)[:8]
     if suffix:
-        suffix = re.sub(r"[^A-Za-z0-9_]", "_", suffix)
+        suffix = _STYLE_NAME_UNSAFE_RE.sub("_", suffix)
     parts = [prefix, scope_key, digest]
     if suffix:
         parts.append(suffix)
@@ -212,7 +372,9 @@ def _enable_autofilter(doc: Document, sheet_ranges: list[tuple[str, int, int]])
         for existing in doc.body.get_elements("table:database-ranges"):
             doc.body.delete(existing)
 
-        db_ranges = Element.from_tag("table:database-ranges")
+        # Serialize all ranges into one fragment and parse it once instead of
+        # building each element attribute by attribute.
+        parts: list[str] = ["<table:database-ranges>"]
 
         for sheet_name, ncols, nrows in sheet_ranges:
             if not sheet_name or ncols <= 0 or nrows <= 0:
@@ -222,24 +384,99 @@ def _enable_autofilter(doc: Document, sheet_ranges: list[tuple[str, int, int]])
             end_row = max(1, int(nrows))
             addr = f"{_quote_sheet_name_for_range(sheet_name)}.A1:{end_col}{end_row}"
 
-            db = Element.from_tag("table:database-range")
-            db.set_attribute("table:name", _make_style_name("db", sheet_name))
-            db.set_attribute("table:target-range-address", addr)
-            db.set_attribute("table:display-filter-buttons", "true")
-            db.set_attribute("table:contains-header", "true")
-
             # Empty filter element; viewers typically treat this as “autofilter on”.
-            flt = Element.from_tag("table:filter")
-            flt.set_attribute("table:display-filter-buttons", "true")
-            db.append(flt)
-
-            db_ranges.append(db)
+            parts.append(
+                f"<table:database-range table:name={quoteattr(_make_style_name('db', sheet_name))}"
+                f" table:target-range-address={quoteattr(addr)}"
+                ' table:display-filter-buttons="true" table:contains-header="true">'
+                '<table:filter table:display-filter-buttons="true"/>'
+                "</table:database-range>"
+            )
 
-        doc.body.append(db_ranges)
+        parts.append("</table:database-ranges>")
+        doc.body.append(Element.from_tag("".join(parts)))
     except Exception:
         return
 
 
+@dataclass(frozen=True)
+class _RenderFlags:
+    """Report layout switches resolved once from the analysis config.
+
+    Attributes:
+        require_evidence:
+            Include the evidence/example quote columns.
+        allow_secondary:
+            Include the primary/secondary role column.
+        explain_assignments:
+            Include the rationale column.
+        list_rejected:
+            Include the rejected assignments column.
+    """
+
+    require_evidence: bool = True
+    allow_secondary: bool = False
+    explain_assignments: bool = False
+    list_rejected: bool = False
+
+
+class _SummaryCounts(dict[tuple[str, str], dict[str, Any]]):
+    """Summary rows keyed by (topic, orientation).
+
+    Looking up a missing key inserts and returns a zero-count row.
+    """
+
+    def __missing__(self, key: tuple[str, str]) -> dict[str, Any]:
+        return self.seed(key)
+
+    def seed(self, key: tuple[str, str]) -> dict[str, Any]:
+        """Return the row for `key`, inserting a zero-count row if missing."""
+
+        topic, orientation = key
+        return self.setdefault(
+            key,
+            {
+                "topic": topic,
+                "orientation": orientation,
+                "count": 0,
+                "example_quote": "",
+            },
+        )
+
+
+# Transcript sheet columns as (row key, header title). Optional columns are only
+# included when enabled by the corresponding YAML settings; the researcher
+# review columns are always present by design.
+_TRANSCRIPT_LEAD_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("topic", "Topic"),
+    ("orientation", "Orientation"),
+)
+_ROLE_COLUMN = ("role", "Role")
+_RATIONALE_COLUMN = ("rationale", "Rationale")
+_REJECTED_COLUMN = ("rejected_assignments", "Rejected Assignments")
+_TRANSCRIPT_REVIEW_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("researcher_decision", "Researcher Decision (accepted/modified/rejected)"),
+    ("final_topic", "Final Topic"),
+    ("final_orientation", "Final Orientation"),
+    ("researcher_comment", "Comment"),
+    ("where_found", "Where Found"),
+)
+_EVIDENCE_COLUMN = ("evidence", "Evidence Quote")
+
+
+def _transcript_columns(flags: _RenderFlags) -> tuple[tuple[str, str], ...]:
+    """Return the transcript sheet columns enabled by the given flags."""
+
+    return (
+        _TRANSCRIPT_LEAD_COLUMNS
+        + ((_ROLE_COLUMN,) if flags.allow_secondary else ())
+        + ((_RATIONALE_COLUMN,) if flags.explain_assignments else ())
+        + ((_REJECTED_COLUMN,) if flags.list_rejected else ())
+        + _TRANSCRIPT_REVIEW_COLUMNS
+        + ((_EVIDENCE_COLUMN,) if flags.require_evidence else ())
+    )
+
+
 @dataclass(frozen=True)
 class WriteOutputAction:
     """
@@ -333,11 +570,19 @@ class WriteOutputAction:
             codebook_topics=config.topics,
         )
 
+        llm_guidance = getattr(config.analysis, "llm_guidance", None)
+        flags = _RenderFlags(
+            require_evidence=bool(getattr(llm_guidance, "require_textual_evidence", True)),
+            allow_secondary=bool(getattr(config.analysis, "allow_secondary_assignments", False)),
+            explain_assignments=bool(getattr(llm_guidance, "explain_assignments", False)),
+            list_rejected=bool(getattr(llm_guidance, "list_rejected_assignments", False)),
+        )
+
         sheet_ranges: list[tuple[str, int, int]] = []
 
-        sheet_ranges.append(self._append_summary_sheet(doc, summary_rows, config=config))
+        sheet_ranges.append(self._append_summary_sheet(doc, summary_rows, flags=flags))
         sheet_ranges.append(self._append_final_count_sheet(doc))
-        sheet_ranges.extend(self._append_transcript_sheets(doc, per_doc_rows, config=config))
+        sheet_ranges.extend(self._append_transcript_sheets(doc, per_doc_rows, flags=flags))
 
         _freeze_first_row_in_settings(doc)
         _enable_autofilter(doc, sheet_ranges)
@@ -351,7 +596,7 @@ class WriteOutputAction:
         documents: list[Any],
         *,
         base_dir: Path,
-        codebook_topics: list[Any] | None = None,
+        codebook_topics: tuple[Any, ...] | None = None,
     ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
         """
         Collect summary and per-document track records from analysis work files.
@@ -366,12 +611,10 @@ class WriteOutputAction:
                 - per-document rows (each includes sheet name and evidence rows)
         """
 
-        topic_order, orientation_order = self._build_codebook_order(codebook_topics or [])
+        topic_order, orientation_order = self._build_codebook_order(codebook_topics or ())
 
         # Pre-seed the summary with all codebook entries so zero-count rows are shown.
-        summary_counts: dict[tuple[str, str], dict[str, Any]] = self._seed_summary_counts(
-            codebook_topics or []
-        )
+        summary_counts = self._seed_summary_counts(codebook_topics or ())
         per_doc: list[dict[str, Any]] = []
 
         loaded: list[dict[str, Any]] = []
@@ -481,7 +724,9 @@ class WriteOutputAction:
                             continue
 
                         kind_norm = "primary"
-                        if isinstance(kind, str) and kind.strip().lower() in {"secondary", "minor", "s"}:
+                        if isinstance(kind, str) and (
+                            kind in _SECONDARY_KINDS or kind.strip().lower() in _SECONDARY_KINDS
+                        ):
                             kind_norm = "secondary"
 
                         rationale_norm = ""
@@ -494,20 +739,12 @@ class WriteOutputAction:
 
                         if kind_norm != "secondary":
                             key = (topic_key, orientation_bucket)
-                            agg = summary_counts.setdefault(
-                                key,
-                                {
-                                    "topic": topic_key,
-                                    "orientation": orientation_bucket,
-                                    "count": 0,
-                                    "example_quote": evidence,
-                                },
-                            )
+                            agg = summary_counts[key]
                             agg["count"] = int(agg.get("count", 0)) + 1
 
-                            # If the summary row was pre-seeded (zero-count), it
-                            # starts with an empty example quote. Use the first
-                            # observed evidence as the example.
+                            # New and pre-seeded (zero-count) rows start with an
+                            # empty example quote. Use the first observed
+                            # evidence as the example.
                             if not str(agg.get("example_quote") or "").strip() and evidence.strip():
                                 agg["example_quote"] = evidence
 
@@ -557,7 +794,7 @@ class WriteOutputAction:
 
     def _build_codebook_order(
         self,
-        topics: list[Any],
+        topics: tuple[Any, ...],
     ) -> tuple[dict[str, int], dict[tuple[str, str], int]]:
         """Build stable ordering maps from the YAML config topics.
 
@@ -580,7 +817,7 @@ class WriteOutputAction:
             topic_order.setdefault(topic_name, t_idx)
 
             orientations = getattr(t, "orientations", None)
-            if not isinstance(orientations, list):
+            if not isinstance(orientations, tuple):
                 continue
 
             if not orientations:
@@ -599,13 +836,13 @@ class WriteOutputAction:
 
         return topic_order, orientation_order
 
-    def _seed_summary_counts(self, topics: list[Any]) -> dict[tuple[str, str], dict[str, Any]]:
+    def _seed_summary_counts(self, topics: tuple[Any, ...]) -> _SummaryCounts:
         """Create summary rows for every codebook topic/orientation pair.
 
         This ensures the Summary sheet includes zero-count entries.
         """
 
-        out: dict[tuple[str, str], dict[str, Any]] = {}
+        out = _SummaryCounts()
         for t in topics:
             topic_name = getattr(t, "topic", None)
             if not isinstance(topic_name, str) or not topic_name.strip():
@@ -613,34 +850,15 @@ class WriteOutputAction:
             topic_name = topic_name.strip()
 
             orientations = getattr(t, "orientations", None)
-            if not isinstance(orientations, list) or not orientations:
-                key = (topic_name, "(none)")
-                out.setdefault(
-                    key,
-                    {
-                        "topic": topic_name,
-                        "orientation": "(none)",
-                        "count": 0,
-                        "example_quote": "",
-                    },
-                )
+            if not isinstance(orientations, tuple) or not orientations:
+                out.seed((topic_name, "(none)"))
                 continue
 
             for o in orientations:
                 label = getattr(o, "label", None)
                 if not isinstance(label, str) or not label.strip():
                     continue
-                label = label.strip()
-                key = (topic_name, label)
-                out.setdefault(
-                    key,
-                    {
-                        "topic": topic_name,
-                        "orientation": label,
-                        "count": 0,
-                        "example_quote": "",
-                    },
-                )
+                out.seed((topic_name, label.strip()))
 
         return out
 
@@ -684,7 +902,7 @@ class WriteOutputAction:
         doc: Document,
         rows: list[dict[str, Any]],
         *,
-        config: InterviewConfig,
+        flags: _RenderFlags,
     ) -> tuple[str, int, int]:
         """
         Add the summary sheet to the ODS document.
@@ -694,6 +912,8 @@ class WriteOutputAction:
                 ODF spreadsheet document.
             rows:
                 Summary rows.
+            flags:
+                Report layout switches.
 
         Returns:
             None
@@ -702,8 +922,6 @@ class WriteOutputAction:
         print("Writing sheet: Summary")
         table = Table("Summary")
 
-        require_evidence = bool(getattr(getattr(config.analysis, "llm_guidance", None), "require_textual_evidence", True))
-
         # Keep the Summary sheet stable, but drop the example quote column when
         # textual evidence is not required/desired.
         columns: list[tuple[str, str]] = [
@@ -711,7 +929,7 @@ class WriteOutputAction:
             ("orientation", "Orientation"),
             ("count", "Count"),
         ]
-        if require_evidence:
+        if flags.require_evidence:
             columns.append(("example_quote", "Example quote"))
 
         # Create a bold header style and apply it to the first row's cells.
@@ -729,14 +947,12 @@ class WriteOutputAction:
             header_style = None
         header_style = _insert_automatic_style(doc, header_style)
 
-        # Compute simple column widths based on content length (cheap heuristic)
-        col_max_chars: list[int] = [0] * len(columns)
-        for c_idx, (_k, title) in enumerate(columns):
-            col_max_chars[c_idx] = max(col_max_chars[c_idx], len(str(title or "")))
-        for r in rows:
-            for c_idx, (key, _title) in enumerate(columns):
-                val = _xml_safe_text(r.get(key, ""))
-                col_max_chars[c_idx] = max(col_max_chars[c_idx], len(str(val)))
+        # Compute simple column widths based on content length (cheap heuristic).
+        # One max() reduction per column keeps the per-cell work in map().
+        col_max_chars: list[int] = [
+            max(len(title), max(map(len, map(_xml_safe_text, (r.get(key, "") for r in rows))), default=0))
+            for key, title in columns
+        ]
 
         # Create and append column styles (table-column) to set widths.
         for c_idx, chars in enumerate(col_max_chars, start=1):
@@ -766,23 +982,7 @@ class WriteOutputAction:
                 # If style/column creation fails, continue without widths
                 pass
 
-        header = Row()
-        for _key, title in columns:
-            cell = Cell(text=_xml_safe_text(title))
-            if header_style is not None:
-                try:
-                    cell.style = header_style
-                except Exception:
-                    pass
-            header.append_cell(cell)
-        # Put header row inside a table-header-rows element so it is treated
-        # as a sheet header by many spreadsheet viewers (helps freezing).
-        try:
-            hdr_group = Element.from_tag("table:table-header-rows")
-            hdr_group.append(header)
-            table.append(hdr_group)
-        except Exception:
-            table.append_row(header)
+        _append_header_row(table, [title for _key, title in columns], header_style)
 
         for r in rows:
             row = Row()
@@ -857,24 +1057,7 @@ class WriteOutputAction:
             except Exception:
                 pass
 
-        header = Row()
-        for title in columns:
-            cell = Cell(text=_xml_safe_text(title))
-            if header_style is not None:
-                try:
-                    cell.style = header_style
-                except Exception:
-                    pass
-            header.append_cell(cell)
-
-        # Put the header row inside a table-header-rows element so it is treated
-        # as a sheet header by many spreadsheet viewers.
-        try:
-            hdr_group = Element.from_tag("table:table-header-rows")
-            hdr_group.append(header)
-            table.append(hdr_group)
-        except Exception:
-            table.append_row(header)
+        _append_header_row(table, columns, header_style)
 
         doc.body.append(table)
 
@@ -886,7 +1069,7 @@ class WriteOutputAction:
         doc: Document,
         per_doc: list[dict[str, Any]],
         *,
-        config: InterviewConfig,
+        flags: _RenderFlags,
     ) -> list[tuple[str, int, int]]:
         """
         Add one sheet per transcript with the full evidence track record.
@@ -896,6 +1079,8 @@ class WriteOutputAction:
                 ODF spreadsheet document.
             per_doc:
                 Per-document data, including sheet names and evidence rows.
+            flags:
+                Report layout switches.
 
         Returns:
             None
@@ -903,36 +1088,9 @@ class WriteOutputAction:
 
         used_names: set[str] = {"Summary", "Final Count"}
 
-        allow_secondary = bool(getattr(config.analysis, "allow_secondary_assignments", False))
-        llm_guidance = getattr(config.analysis, "llm_guidance", None)
-        explain_assignments = bool(getattr(llm_guidance, "explain_assignments", False))
-        list_rejected = bool(getattr(llm_guidance, "list_rejected_assignments", False))
-        require_evidence = bool(getattr(llm_guidance, "require_textual_evidence", True))
-
-        # Only include columns that are enabled by the corresponding YAML settings.
-        # The two researcher review columns are always present by design.
-        columns: list[tuple[str, str]] = [
-            ("topic", "Topic"),
-            ("orientation", "Orientation"),
-        ]
-        if allow_secondary:
-            columns.append(("role", "Role"))
-        if explain_assignments:
-            columns.append(("rationale", "Rationale"))
-        if list_rejected:
-            columns.append(("rejected_assignments", "Rejected Assignments"))
-        columns.extend(
-            [
-                ("researcher_decision", "Researcher Decision (accepted/modified/rejected)"),
-                ("final_topic", "Final Topic"),
-                ("final_orientation", "Final Orientation"),
-                ("researcher_comment", "Comment"),
-                ("where_found", "Where Found"),
-            ]
-        )
-        if require_evidence:
-            columns.append(("evidence", "Evidence Quote"))
-
+        columns = _transcript_columns(flags)
+        keys = tuple(key for key, _title in columns)
+        titles = [title for _key, title in columns]
         out: list[tuple[str, int, int]] = []
 
         for entry in per_doc:
@@ -958,18 +1116,11 @@ class WriteOutputAction:
                 header_style = None
             header_style = _insert_automatic_style(doc, header_style)
 
-            # Compute column widths from header and data
-            rows = entry.get("rows") or []
-            col_max_chars: list[int] = [0] * len(columns)
-            for c_idx, (_k, title) in enumerate(columns):
-                col_max_chars[c_idx] = max(col_max_chars[c_idx], len(str(title or "")))
-            if isinstance(rows, list):
-                for r in rows:
-                    if not isinstance(r, dict):
-                        continue
-                    for c_idx, (key, _title) in enumerate(columns):
-                        val = _xml_safe_text(r.get(key, ""))
-                        col_max_chars[c_idx] = max(col_max_chars[c_idx], len(str(val)))
+            # Column widths from header and data. The data rows are serialized
+            # here and appended after the header.
+            rows = entry.get("rows")
+            data_widths, rows_xml = _serialize_transcript_rows(rows, keys)
+            col_max_chars = [max(len(title), w) for (_key, title), w in zip(columns, data_widths)]
 
             # Create and append column styles (table-column)
             for c_idx, chars in enumerate(col_max_chars, start=1):
@@ -996,31 +1147,9 @@ class WriteOutputAction:
                 except Exception:
                     pass
 
-            header = Row()
-            for _key, title in columns:
-                cell = Cell(text=_xml_safe_text(title))
-                if header_style is not None:
-                    try:
-                        cell.style = header_style
-                    except Exception:
-                        pass
-                header.append_cell(cell)
-            try:
-                hdr_group = Element.from_tag("table:table-header-rows")
-                hdr_group.append(header)
-                table.append(hdr_group)
-            except Exception:
-                table.append_row(header)
+            _append_header_row(table, titles, header_style)
 
-            rows = entry.get("rows")
-            if isinstance(rows, list):
-                for r in rows:
-                    if not isinstance(r, dict):
-                        continue
-                    row = Row()
-                    for key, _title in columns:
-                        row.append_cell(Cell(text=_xml_safe_text(r.get(key, ""))))
-                    table.append_row(row)
+            _append_rows_xml(table, rows_xml)
 
             doc.body.append(table)
 
@@ -1036,10 +1165,7 @@ class WriteOutputAction:
         """
 
         base = str(display_id or "Transcript").strip() or "Transcript"
-        base = _xml_safe_text(base)
-        base = base.replace("\n", " ").replace("\r", " ")
-        base = base.replace("/", "_").replace("\\", "_")
-        return base[:31]
+        return _xml_safe_text(base).translate(_SHEET_NAME_TABLE)[:31]
 
     def _display_id(
         self,
@@ -1075,29 +1201,20 @@ class WriteOutputAction:
                     pass
                 return rel.as_posix()
 
-        return re.sub(r"-[0-9a-f]{10}$", "", doc_id)
+        return _DOC_ID_HASH_SUFFIX_RE.sub("", doc_id)
 
     def _pretty_where_found(self, where_found: str, *, doc_id: str, display_id: str) -> str:
         """Rewrite internal IDs into prettier report identifiers."""
 
-        # 1) Prefer an exact match for this document's internal id.
-        prefix = f"{doc_id}:"
-        out = where_found
-        if prefix:
-            out = out.replace(prefix, f"{display_id}:")
+        # Both rewrites need a `<id>:` reference.
+        if ":" not in where_found:
+            return where_found
 
-        # 2) Also strip any "-<10hex>" suffix used in internal document ids.
-        # This fixes cases where the analysis file's `document_id` or the
-        # evidence ids are not perfectly aligned.
         def _repl(m: re.Match[str]) -> str:
-            return f"{display_id}:{m.group(2)}"
+            ref = m.group("ref")
+            return f"{display_id}:{ref}" if ref is not None else f"{display_id}:"
 
-        out = re.sub(
-            r"\b([A-Za-z0-9_-]+)-[0-9a-f]{10}:(p\d{4}(?:-p\d{4})?)\b",
-            _repl,
-            out,
-        )
-        return out
+        return _where_found_re(doc_id).sub(_repl, where_found)
 
     def _pretty_paragraph_ref(self, para_id: str) -> str:
         """Return a compact paragraph reference for per-transcript sheets.
@@ -1122,29 +1239,10 @@ class WriteOutputAction:
         if not isinstance(value, list) or not value:
             return ""
 
-        parts: list[str] = []
-        for item in value:
-            if not isinstance(item, dict):
-                continue
-            topic = item.get("topic")
-            orientation = item.get("orientation")
-            if not isinstance(topic, str) or not topic.strip():
-                continue
-
-            topic_key = topic.strip()
-            orientation_key = ""
-            if isinstance(orientation, str) and orientation.strip():
-                orientation_key = orientation.strip()
-
-            label = topic_key
-            if orientation_key:
-                label = f"{label} ({orientation_key})"
-            parts.append(_xml_safe_text(label))
-
-            if len(parts) >= 5:
-                break
-
-        return _xml_safe_text(" | ".join(parts))
+        # Parts are sanitized individually, so the joined string needs no
+        # second pass. Only the first five assignments are shown.
+        labels = (_rejected_assignment_label(item) for item in value)
+        return " | ".join(islice((label for label in labels if label is not None), 5))
 
     def _unique_sheet_name(self, name: str, used: set[str]) -> str:
         """
@@ -1160,8 +1258,7 @@ class WriteOutputAction:
             A unique name.
         """
 
-        candidate = _xml_safe_text(name)
-        candidate = candidate.replace("\n", " ").replace("\r", " ")[:31]
+        candidate = _xml_safe_text(name).translate(_SHEET_NAME_TABLE)[:31]
         if candidate not in used:
             return candidate
 
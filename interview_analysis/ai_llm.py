@@ -18,8 +18,11 @@ Environment variables:
     - `LLM_OPENAI_PATH`: Optional path (legacy)
 """
 
+import asyncio
+import functools
 import json
 import os
+import weakref
 
 from typing import Any, TypeAlias, cast
 
@@ -36,11 +39,20 @@ JsonValue: TypeAlias = (
     | None
 )
 
+# One client (and thus one HTTP connection pool) per event loop. httpx pools are
+# bound to the loop they were created on, so clients are not shared across
+# separate `asyncio.run()` calls.
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI] = weakref.WeakKeyDictionary()
 
+
+@functools.lru_cache(maxsize=None)
 def _require_env(name: str) -> str:
     """
     Get a required environment variable.
 
+    Values are cached after the first successful lookup, as the environment is
+    loaded once at startup. Call `_require_env.cache_clear()` to re-read it.
+
     Args:
         name:
             Environment variable name.
@@ -59,10 +71,13 @@ def _require_env(name: str) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=1)
 def _openai_base_url() -> str:
     """
     Determine the base URL for the OpenAI-compatible endpoint.
 
+    Cached like `_require_env()`; use `_openai_base_url.cache_clear()` to re-read.
+
     Returns:
         Base URL ending with `/v1`.
     """
@@ -84,6 +99,28 @@ def _openai_base_url() -> str:
     return f"https://{host}{prefix}"
 
 
+def _get_client() -> AsyncOpenAI:
+    """
+    Return the API client for the running event loop.
+
+    The client is created on first use and then reused, so that subsequent
+    requests can reuse open connections instead of a new TLS handshake each.
+
+    Returns:
+        Shared `AsyncOpenAI` client.
+    """
+
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=_require_env("LLM_OPENAI_API_KEY"),
+            base_url=_openai_base_url(),
+        )
+        _clients[loop] = client
+    return client
+
+
 def _parse_json_content(content: str) -> JsonValue:
     """
     Parse JSON content from the model response.
@@ -96,7 +133,8 @@ def _parse_json_content(content: str) -> JsonValue:
         Parsed JSON value. Returns None for empty responses.
     """
 
-    if not content.strip():
+    # isspace() stops at the first non-blank character and copies nothing.
+    if not content or content.isspace():
         return None
     return cast(JsonValue, json.loads(content))
 
@@ -156,10 +194,7 @@ async def ai_conversation(
         (when `parse_json` is true).
     """
 
-    client = AsyncOpenAI(
-        api_key=_require_env("LLM_OPENAI_API_KEY"),
-        base_url=_openai_base_url(),
-    )
+    client = _get_client()
 
     try:
         completion_kwargs: dict[str, Any] = {}
@@ -42,13 +42,18 @@ def _action_repository():
 	return {a.name: a for a in actions}
 
 
-def build_parser() -> argparse.ArgumentParser:
+def build_parser(actions=None) -> argparse.ArgumentParser:
 	"""
 	Build the top-level argument parser.
 
 	The parser uses subcommands (similar to `git`) where each action registers its
 	own arguments.
 
+	Args:
+		actions:
+			Optional action registry from `_action_repository()`. If omitted, a
+			new one is constructed.
+
 	Returns:
 		The configured ArgumentParser instance.
 	"""
@@ -59,7 +64,8 @@ def build_parser() -> argparse.ArgumentParser:
 		),
 	)
 
-	actions = _action_repository()
+	if actions is None:
+		actions = _action_repository()
 
 	config_parent = argparse.ArgumentParser(add_help=False)
 	config_parent.add_argument(
@@ -100,11 +106,11 @@ def main(argv: list[str] | None = None) -> int:
 	"""
 	load_dotenv()
 
-	parser = build_parser()
+	actions = _action_repository()
+	parser = build_parser(actions)
 	args = parser.parse_args(argv)
 
 	try:
-		actions = _action_repository()
 		action_name = getattr(args, "_action_name", None)
 		if not action_name or action_name not in actions:
 			parser.error("Unknown or missing command")
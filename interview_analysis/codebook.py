@@ -16,45 +16,48 @@ is passed to the LLM and written into analysis work files.
 import json
 from typing import Any
 
-from interview_analysis.config import OrientationSpec, TopicSpec
+from interview_analysis.config import TopicSpec
 from interview_analysis.hash_utils import md5_text
 
+# Canonical JSON form used for hashing. Reusing one encoder avoids building a
+# new JSONEncoder on every `json.dumps()` call with non-default options.
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(",", ":"))
 
-def build_codebook(topics: list[TopicSpec]) -> dict[str, Any]:
+
+def _codebook_entry(idx: int, spec: TopicSpec) -> dict[str, Any]:
+    """Build the codebook entry for a single topic (1-based index)."""
+
+    orientation_details: list[dict[str, Any]] = []
+    for o in spec.orientations:
+        label = o.label.strip()
+        if not label:
+            continue
+        detail: dict[str, Any] = {"label": label}
+        o_desc = o.description.strip() if isinstance(o.description, str) else ""
+        if o_desc:
+            detail["description"] = o_desc
+        orientation_details.append(detail)
+
+    entry: dict[str, Any] = {
+        "id": f"t{idx}",
+        "topic": spec.topic,
+        # Keep "orientations" as a list of strings for backwards compatibility
+        # with existing prompting/validation logic.
+        "orientations": [d["label"] for d in orientation_details],
+        "allow_multiple_orientations": bool(spec.allow_multiple_orientations),
+    }
+    description = spec.description.strip() if isinstance(spec.description, str) else ""
+    if description:
+        entry["description"] = description
+    if orientation_details:
+        entry["orientation_details"] = orientation_details
+    return entry
+
+
+def build_codebook(topics: tuple[TopicSpec, ...]) -> dict[str, Any]:
     """Build the codebook structure passed to the LLM and written to work files."""
 
-    out: list[dict[str, Any]] = []
-    for idx, spec in enumerate(topics, start=1):
-        orientation_labels: list[str] = []
-        orientation_details: list[dict[str, Any]] = []
-
-        for o in spec.orientations:
-            if not isinstance(o, OrientationSpec):
-                continue
-            label = o.label.strip()
-            if not label:
-                continue
-            orientation_labels.append(label)
-            detail: dict[str, Any] = {"label": label}
-            if isinstance(o.description, str) and o.description.strip():
-                detail["description"] = o.description.strip()
-            orientation_details.append(detail)
-
-        entry: dict[str, Any] = {
-            "id": f"t{idx}",
-            "topic": spec.topic,
-            # Keep "orientations" as a list of strings for backwards compatibility
-            # with existing prompting/validation logic.
-            "orientations": orientation_labels,
-            "allow_multiple_orientations": bool(getattr(spec, "allow_multiple_orientations", False)),
-        }
-        if isinstance(spec.description, str) and spec.description.strip():
-            entry["description"] = spec.description.strip()
-        if orientation_details:
-            entry["orientation_details"] = orientation_details
-        out.append(entry)
-
-    return {"topics": out}
+    return {"topics": [_codebook_entry(idx, spec) for idx, spec in enumerate(topics, start=1)]}
 
 
 def codebook_hash(codebook: dict[str, Any]) -> str:
@@ -64,8 +67,7 @@ def codebook_hash(codebook: dict[str, Any]) -> str:
     LLM coding even if segments did not change.
     """
 
-    canonical = json.dumps(codebook, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
-    return md5_text(canonical)
+    return md5_text(_CANONICAL_JSON.encode(codebook))
 
 
 def orientations_by_topic(codebook: dict[str, Any]) -> dict[str, list[str]]:
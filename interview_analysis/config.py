@@ -13,14 +13,27 @@ This module handles reading `interviews.yaml`, validating required keys, and
 normalizing paths so that downstream actions can rely on a typed config object.
 """
 
+import fnmatch
+import functools
+import os
+import re
+import stat
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Use the libyaml-backed loader when PyYAML was built with it; the pure Python
+# loader is much slower. yaml_io reuses this selection for the work files.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class OrientationSpec:
     """Orientation definition.
 
@@ -35,7 +48,7 @@ class OrientationSpec:
     description: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TopicSpec:
     """
     Topic definition with its allowed orientations.
@@ -55,12 +68,12 @@ class TopicSpec:
     """
 
     topic: str
-    orientations: list[OrientationSpec]
+    orientations: tuple[OrientationSpec, ...]
     allow_multiple_orientations: bool = False
     description: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SegmentationConfig:
     """
     Configuration for transcript segmentation.
@@ -77,7 +90,7 @@ class SegmentationConfig:
     overlap_paragraphs: int = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LlmGuidanceConfig:
     """Optional flags that control LLM instructions.
 
@@ -92,7 +105,7 @@ class LlmGuidanceConfig:
     reasoning_language: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisConfig:
     """
     Configuration for the topic coding step.
@@ -139,7 +152,7 @@ class AnalysisConfig:
     llm_guidance: LlmGuidanceConfig = field(default_factory=LlmGuidanceConfig)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InterviewConfig:
     """
     Parsed configuration for an interview analysis run.
@@ -153,6 +166,9 @@ class InterviewConfig:
             Glob pattern(s) for transcript files to include.
         exclude:
             Optional glob pattern(s) for transcript files to exclude.
+        exclude_re:
+            All exclude patterns compiled into one regular expression, matched
+            against POSIX paths relative to `base_dir`. None without excludes.
         workdir:
             Directory for intermediate outputs.
         outfile:
@@ -167,16 +183,36 @@ class InterviewConfig:
 
     config_path: Path
     base_dir: Path
-    include: list[str]
-    exclude: list[str] | None
+    include: tuple[str, ...]
+    exclude: tuple[str, ...] | None
     workdir: Path
     outfile: Path
-    topics: list[TopicSpec]
+    topics: tuple[TopicSpec, ...]
     segmentation: SegmentationConfig
     analysis: AnalysisConfig
+    exclude_re: re.Pattern[str] | None = None
+
+
+# Upper bound for interviews.yaml. Real configs are a few KB; anything this big
+# is a wrong file and would only make the YAML parser allocate a lot of memory.
+_MAX_CONFIG_BYTES = 4 * 1024 * 1024
+
+# Top-level keys every config must define, and those holding a relative path.
+_REQUIRED_TOP_KEYS = ("include", "workdir", "outfile", "topics")
+_PATH_TOP_KEYS = ("workdir", "outfile")
+
+# Supported values of `analysis.strategy`.
+_ANALYSIS_STRATEGIES = frozenset({"segment", "topic"})
+
+# Default instances for parser fallbacks. On slotted dataclasses the class
+# attributes are slot descriptors, not the field defaults.
+_DEFAULT_TOPIC = TopicSpec(topic="", orientations=())
+_DEFAULT_SEGMENTATION = SegmentationConfig()
+_DEFAULT_ANALYSIS = AnalysisConfig()
+_DEFAULT_LLM_GUIDANCE = LlmGuidanceConfig()
 
 
-def _parse_patterns(value: Any, *, key: str, required: bool) -> list[str] | None:
+def _parse_patterns(value: Any, *, key: str, required: bool) -> tuple[str, ...] | None:
     """Parse a config field that can be a string or list of strings."""
 
     if value is None:
@@ -184,17 +220,17 @@ def _parse_patterns(value: Any, *, key: str, required: bool) -> list[str] | None
             raise ConfigError(f"'{key}' must be a non-empty string or a non-empty list of strings")
         return None
 
-    if isinstance(value, str):
-        if not value.strip():
+    if type(value) is str:
+        pattern = value.strip()
+        if not pattern:
             raise ConfigError(f"'{key}' must be a non-empty string")
-        return [value.strip()]
-
-    if isinstance(value, list):
-        out: list[str] = []
-        for idx, item in enumerate(value, start=1):
-            if not isinstance(item, str) or not item.strip():
-                raise ConfigError(f"'{key}' list entries must be non-empty strings (problem at index {idx})")
-            out.append(item.strip())
+        return (pattern,)
+
+    if type(value) is list:
+        out = tuple(item.strip() if type(item) is str else "" for item in value)
+        if not all(out):
+            idx = out.index("") + 1
+            raise ConfigError(f"'{key}' list entries must be non-empty strings (problem at index {idx})")
         if required and not out:
             raise ConfigError(f"'{key}' must be a non-empty list")
         return out
@@ -202,6 +238,46 @@ def _parse_patterns(value: Any, *, key: str, required: bool) -> list[str] | None
     raise ConfigError(f"'{key}' must be a string or a list of strings")
 
 
+def normalize_glob_pattern(pattern: str) -> str:
+    """
+    Normalize user-provided glob patterns to Python's recursive glob syntax.
+
+    The sample config uses `**.odt`, which is not a standard recursive glob
+    segment. This function converts patterns like `**.odt` to `**/*.odt`.
+
+    Args:
+        pattern:
+            Raw pattern from config.
+
+    Returns:
+        A pattern suitable for `glob.glob(..., recursive=True)`.
+    """
+
+    p = pattern.strip()
+    if p.startswith("**.") and "/" not in p:
+        ext = p[3:]
+        return f"**/*.{ext}"
+    if p == "**" or p == "**/":
+        return "**/*"
+    return p
+
+
+def _compile_glob_patterns(patterns: tuple[str, ...] | None) -> re.Pattern[str] | None:
+    """
+    Compile glob patterns into one regular expression with `fnmatch` semantics.
+
+    Matching a path against the union is a single regex match instead of one
+    `fnmatch.fnmatch()` call per pattern. Like `fnmatch`, matching ignores case
+    on platforms with case-insensitive paths.
+    """
+
+    if not patterns:
+        return None
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    union = "|".join(fnmatch.translate(normalize_glob_pattern(p)) for p in patterns)
+    return re.compile(union, flags)
+
+
 class ConfigError(RuntimeError):
     """
     Raised when the YAML configuration is missing, invalid, or cannot be parsed.
@@ -228,7 +304,27 @@ def find_config_path(cli_path: str | None) -> Path:
     return Path.cwd() / "interviews.yaml"
 
 
-def _parse_topics(value: Any) -> list[TopicSpec]:
+def _parse_description(item: dict[Any, Any], *, error: str) -> str | None:
+    """Return the optional `description` (alias `hint`) of a topic/orientation.
+
+    Raises:
+        ConfigError:
+            With the given message if the value is present but not a non-empty
+            string.
+    """
+
+    value = item.get("description")
+    if value is None:
+        value = item.get("hint")
+    if value is None:
+        return None
+    text = value.strip() if type(value) is str else ""
+    if not text:
+        raise ConfigError(error)
+    return text
+
+
+def _parse_topics(value: Any) -> tuple[TopicSpec, ...]:
     """
     Parse and validate the `topics` section from the YAML.
 
@@ -250,92 +346,83 @@ def _parse_topics(value: Any) -> list[TopicSpec]:
             Raw YAML value.
 
     Returns:
-        A list of TopicSpec objects.
+        A tuple of TopicSpec objects.
 
     Raises:
         ConfigError:
             If the structure does not match the expected schema.
     """
 
-    if not isinstance(value, list) or not value:
+    if type(value) is not list or not value:
         raise ConfigError("'topics' must be a non-empty list")
 
-    topics: list[TopicSpec] = []
-    for idx, item in enumerate(value, start=1):
-        if isinstance(item, str):
-            if not item.strip():
-                raise ConfigError(f"Topic must be a non-empty string (problem at index {idx})")
-            topics.append(TopicSpec(topic=item.strip(), orientations=[]))
-            continue
+    return tuple(_parse_topic(item, idx) for idx, item in enumerate(value, start=1))
 
-        if not isinstance(item, dict):
-            raise ConfigError(
-                f"Each item in 'topics' must be a string or mapping (problem at index {idx})"
-            )
 
-        # Legacy format: {"Topic name": ["Orientation", ...]}
-        if len(item) == 1 and "topic" not in item:
-            (topic_name, orientations) = next(iter(item.items()))
-            if not isinstance(topic_name, str) or not topic_name.strip():
-                raise ConfigError(f"Topic name must be a non-empty string (problem at index {idx})")
+def _parse_topic(item: Any, idx: int) -> TopicSpec:
+    """Parse a single `topics` entry (1-based index `idx`, for error messages)."""
 
-            if orientations is None:
-                topics.append(TopicSpec(topic=topic_name.strip(), orientations=[]))
-                continue
+    if type(item) is str:
+        name = item.strip()
+        if not name:
+            raise ConfigError(f"Topic must be a non-empty string (problem at index {idx})")
+        return TopicSpec(topic=sys.intern(name), orientations=())
 
-            parsed_orientations = _parse_orientations(
-                orientations,
-                topic_name=topic_name.strip(),
-                context=f"topics[{idx}]",
-            )
+    if type(item) is not dict:
+        raise ConfigError(
+            f"Each item in 'topics' must be a string or mapping (problem at index {idx})"
+        )
 
-            topics.append(TopicSpec(topic=topic_name.strip(), orientations=parsed_orientations))
-            continue
+    # Legacy format: {"Topic name": ["Orientation", ...]}
+    if len(item) == 1 and "topic" not in item:
+        (topic_name,) = item
+        orientations = item[topic_name]
+        name = topic_name.strip() if type(topic_name) is str else ""
+        if not name:
+            raise ConfigError(f"Topic name must be a non-empty string (problem at index {idx})")
+
+        parsed_orientations = _parse_orientations(
+            orientations,
+            topic_name=name,
+            context=f"topics[{idx}]",
+        )
 
-        # Expanded format: {topic: ..., orientations?: [...], description?: ...}
-        topic_name = item.get("topic")
-        if not isinstance(topic_name, str) or not topic_name.strip():
-            raise ConfigError(
-                f"Expanded topic entry must have a non-empty 'topic' field (problem at index {idx})"
-            )
+        return TopicSpec(topic=sys.intern(name), orientations=parsed_orientations)
 
-        orientations_value = item.get("orientations")
-        orientations = _parse_orientations(
-            orientations_value,
-            topic_name=topic_name.strip(),
-            context=f"topics[{idx}].orientations",
+    # Expanded format: {topic: ..., orientations?: [...], description?: ...}
+    topic_name = item.get("topic")
+    name = topic_name.strip() if type(topic_name) is str else ""
+    if not name:
+        raise ConfigError(
+            f"Expanded topic entry must have a non-empty 'topic' field (problem at index {idx})"
         )
 
-        description_value = item.get("description")
-        if description_value is None:
-            description_value = item.get("hint")
-
-        if description_value is not None and (
-            not isinstance(description_value, str) or not description_value.strip()
-        ):
-            raise ConfigError(
-                f"description for topic '{topic_name}' must be a non-empty string if provided"
-            )
+    orientations = _parse_orientations(
+        item.get("orientations"),
+        topic_name=name,
+        context=f"topics[{idx}].orientations",
+    )
 
-        allow_multiple = item.get("allow_multiple_orientations", TopicSpec.allow_multiple_orientations)
-        if not isinstance(allow_multiple, bool):
-            raise ConfigError(
-                f"allow_multiple_orientations for topic '{topic_name}' must be a boolean if provided"
-            )
+    description = _parse_description(
+        item,
+        error=f"description for topic '{topic_name}' must be a non-empty string if provided",
+    )
 
-        topics.append(
-            TopicSpec(
-                topic=topic_name.strip(),
-                orientations=orientations,
-                allow_multiple_orientations=allow_multiple,
-                description=description_value.strip() if isinstance(description_value, str) else None,
-            )
+    allow_multiple = item.get("allow_multiple_orientations", _DEFAULT_TOPIC.allow_multiple_orientations)
+    if not isinstance(allow_multiple, bool):
+        raise ConfigError(
+            f"allow_multiple_orientations for topic '{topic_name}' must be a boolean if provided"
         )
 
-    return topics
+    return TopicSpec(
+        topic=sys.intern(name),
+        orientations=orientations,
+        allow_multiple_orientations=allow_multiple,
+        description=description,
+    )
 
 
-def _parse_orientations(value: Any, *, topic_name: str, context: str) -> list[OrientationSpec]:
+def _parse_orientations(value: Any, *, topic_name: str, context: str) -> tuple[OrientationSpec, ...]:
     """Parse the orientations list for a single topic.
 
     Supported orientation formats:
@@ -346,55 +433,56 @@ def _parse_orientations(value: Any, *, topic_name: str, context: str) -> list[Or
     """
 
     if value is None:
-        return []
+        return ()
 
-    if not isinstance(value, list):
+    if type(value) is not list:
         raise ConfigError(f"orientations for topic '{topic_name}' must be a list if provided ({context})")
 
-    out: list[OrientationSpec] = []
-    for o_idx, o in enumerate(value, start=1):
-        if isinstance(o, str):
-            if not o.strip():
-                raise ConfigError(
-                    f"Orientation label must be a non-empty string for topic '{topic_name}' ({context}[{o_idx}])"
-                )
-            out.append(OrientationSpec(label=o.strip()))
-            continue
-
-        if not isinstance(o, dict):
-            raise ConfigError(
-                f"Orientation must be a string or mapping for topic '{topic_name}' ({context}[{o_idx}])"
-            )
+    return tuple(
+        _parse_orientation(o, topic_name=topic_name, context=context, o_idx=o_idx)
+        for o_idx, o in enumerate(value, start=1)
+    )
 
-        label_value: Any | None = None
-        description_value: Any | None = None
 
-        if "label" in o or "orientation" in o:
-            label_value = o.get("label") if "label" in o else o.get("orientation")
-            description_value = o.get("description")
-            if description_value is None:
-                description_value = o.get("hint")
-        elif len(o) == 1:
-            (k, v) = next(iter(o.items()))
-            label_value = k
-            description_value = v
+def _parse_orientation(o: Any, *, topic_name: str, context: str, o_idx: int) -> OrientationSpec:
+    """Parse a single orientation entry (1-based index `o_idx`, for error messages)."""
 
-        if not isinstance(label_value, str) or not label_value.strip():
+    if type(o) is str:
+        label = o.strip()
+        if not label:
             raise ConfigError(
-                f"Orientation mapping must define a non-empty label for topic '{topic_name}' ({context}[{o_idx}])"
+                f"Orientation label must be a non-empty string for topic '{topic_name}' ({context}[{o_idx}])"
             )
+        return OrientationSpec(label=sys.intern(label))
 
-        desc: str | None = None
-        if description_value is not None:
-            if not isinstance(description_value, str) or not description_value.strip():
-                raise ConfigError(
-                    f"Orientation description must be a non-empty string for topic '{topic_name}' ({context}[{o_idx}])"
-                )
-            desc = description_value.strip()
+    if type(o) is not dict:
+        raise ConfigError(
+            f"Orientation must be a string or mapping for topic '{topic_name}' ({context}[{o_idx}])"
+        )
 
-        out.append(OrientationSpec(label=label_value.strip(), description=desc))
+    label_value: Any | None = None
+    description_source: dict[Any, Any] = o
 
-    return out
+    if "label" in o or "orientation" in o:
+        label_value = o.get("label") if "label" in o else o.get("orientation")
+    elif len(o) == 1:
+        (label_value,) = o
+        description_source = {"description": o[label_value]}
+    else:
+        description_source = {}
+
+    label = label_value.strip() if type(label_value) is str else ""
+    if not label:
+        raise ConfigError(
+            f"Orientation mapping must define a non-empty label for topic '{topic_name}' ({context}[{o_idx}])"
+        )
+
+    desc = _parse_description(
+        description_source,
+        error=f"Orientation description must be a non-empty string for topic '{topic_name}' ({context}[{o_idx}])",
+    )
+
+    return OrientationSpec(label=sys.intern(label), description=desc)
 
 
 def load_config(path: Path) -> InterviewConfig:
@@ -414,23 +502,47 @@ def load_config(path: Path) -> InterviewConfig:
             missing required keys.
     """
 
-    if not path.exists():
+    # One stat() call answers both "exists?" and "is a regular file?".
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         raise ConfigError(
             "No interviews.yaml found in current directory and no --config provided. "
             "Use the 'template' command to create one or pass --config PATH."
-        )
-    if not path.is_file():
+        ) from None
+    except OSError as exc:
+        raise ConfigError(f"Cannot access config file: {path}: {exc}") from exc
+    if not stat.S_ISREG(st.st_mode):
         raise ConfigError(f"Config path is not a file: {path}")
+    if st.st_size > _MAX_CONFIG_BYTES:
+        raise ConfigError(
+            f"Config file too large: {path} ({st.st_size} bytes, limit {_MAX_CONFIG_BYTES} bytes)"
+        )
+
+    # Repeated loads in one process are served from memory until the file
+    # changes. The absolute path keeps relative paths apart across cwd changes.
+    return _load_config_cached(path.absolute(), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: Path, mtime_ns: int, size: int) -> InterviewConfig:
+    """
+    Parse and validate a config file (cached by path and file stat).
+
+    `mtime_ns` and `size` are only part of the cache key.
+    """
 
     try:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        # Let the parser read and decode the file itself; no full str copy.
+        with path.open("rb") as handle:
+            raw = yaml.load(handle, Loader=_YamlLoader)
     except Exception as exc:  # noqa: BLE001
         raise ConfigError(f"Failed to read YAML config: {path}: {exc}") from exc
 
     if not isinstance(raw, dict):
         raise ConfigError("Config YAML must contain a mapping at the top level")
 
-    missing = [k for k in ("include", "workdir", "outfile", "topics") if k not in raw]
+    missing = [k for k in _REQUIRED_TOP_KEYS if k not in raw]
     if missing:
         raise ConfigError(f"Config is missing required key(s): {', '.join(missing)}")
 
@@ -439,13 +551,15 @@ def load_config(path: Path) -> InterviewConfig:
 
     exclude = _parse_patterns(raw.get("exclude"), key="exclude", required=False)
 
-    workdir = raw.get("workdir")
-    if not isinstance(workdir, str) or not workdir.strip():
-        raise ConfigError("'workdir' must be a non-empty string")
-
-    outfile = raw.get("outfile")
-    if not isinstance(outfile, str) or not outfile.strip():
-        raise ConfigError("'outfile' must be a non-empty string")
+    # Plain string settings (paths relative to the config file).
+    paths: dict[str, str] = {}
+    for key in _PATH_TOP_KEYS:
+        value = raw[key]
+        if type(value) is not str or not value or value.isspace():
+            raise ConfigError(f"'{key}' must be a non-empty string")
+        paths[key] = value
+    workdir = paths["workdir"]
+    outfile = paths["outfile"]
 
     topics = _parse_topics(raw.get("topics"))
 
@@ -455,8 +569,8 @@ def load_config(path: Path) -> InterviewConfig:
 
     # Interpret workdir/outfile and glob patterns relative to config file location.
     base_dir = path.parent.resolve()
-    workdir_path = (base_dir / workdir).resolve()
-    outfile_path = (base_dir / outfile).resolve()
+    workdir_path = _config_relative_path(base_dir, workdir)
+    outfile_path = _config_relative_path(base_dir, outfile)
 
     return InterviewConfig(
         config_path=path.resolve(),
@@ -468,9 +582,38 @@ def load_config(path: Path) -> InterviewConfig:
         topics=topics,
         segmentation=segmentation,
         analysis=analysis,
+        exclude_re=_compile_glob_patterns(exclude),
     )
 
 
+def clear_config_cache() -> None:
+    """
+    Drop all configurations memoized by `load_config()`.
+
+    Needed only when a config file is rewritten without changing its size or
+    modification time, e.g. on filesystems with coarse timestamps.
+    """
+
+    _load_config_cached.cache_clear()
+
+
+def _config_relative_path(base_dir: Path, value: str) -> Path:
+    """
+    Interpret a configured path relative to the (resolved) config directory.
+
+    Plain paths are normalized lexically with `os.path.normpath()`, without any
+    filesystem access. Symlinks inside them are kept rather than resolved, which
+    makes no difference for file operations. A `..` component is different: after
+    a symlink it refers to the parent of the link target, which only the
+    filesystem knows. Such paths are therefore resolved with `Path.resolve()`.
+    """
+
+    joined = base_dir / value
+    if ".." in Path(value).parts:
+        return joined.resolve()
+    return Path(os.path.normpath(joined))
+
+
 def _parse_segmentation(value: Any) -> SegmentationConfig:
     """
     Parse and validate the optional `segmentation` section.
@@ -493,8 +636,8 @@ def _parse_segmentation(value: Any) -> SegmentationConfig:
     if not isinstance(value, dict):
         raise ConfigError("'segmentation' must be a mapping if provided")
 
-    segment_paragraphs = value.get("segment_paragraphs", SegmentationConfig.segment_paragraphs)
-    overlap_paragraphs = value.get("overlap_paragraphs", SegmentationConfig.overlap_paragraphs)
+    segment_paragraphs = value.get("segment_paragraphs", _DEFAULT_SEGMENTATION.segment_paragraphs)
+    overlap_paragraphs = value.get("overlap_paragraphs", _DEFAULT_SEGMENTATION.overlap_paragraphs)
 
     if not isinstance(segment_paragraphs, int):
         raise ConfigError("segmentation.segment_paragraphs must be an integer")
@@ -538,31 +681,31 @@ def _parse_analysis(value: Any) -> AnalysisConfig:
     if not isinstance(value, dict):
         raise ConfigError("'analysis' must be a mapping if provided")
 
-    exclude_interviewer = value.get("exclude_interviewer", AnalysisConfig.exclude_interviewer)
-    strategy = value.get("strategy", AnalysisConfig.strategy)
+    exclude_interviewer = value.get("exclude_interviewer", _DEFAULT_ANALYSIS.exclude_interviewer)
+    strategy = value.get("strategy", _DEFAULT_ANALYSIS.strategy)
     rules_raw = value.get("rules", None)
     allow_secondary = value.get(
         "allow_secondary_assignments",
-        AnalysisConfig.allow_secondary_assignments,
+        _DEFAULT_ANALYSIS.allow_secondary_assignments,
     )
     allow_multiple_primary = value.get(
         "allow_multiple_primary_assignments",
-        AnalysisConfig.allow_multiple_primary_assignments,
+        _DEFAULT_ANALYSIS.allow_multiple_primary_assignments,
     )
     llm_guidance_raw = value.get("llm_guidance", None)
 
     if not isinstance(exclude_interviewer, bool):
         raise ConfigError("analysis.exclude_interviewer must be a boolean")
-    if not isinstance(strategy, str) or not strategy.strip():
+    strategy_norm = strategy.strip().lower() if isinstance(strategy, str) else ""
+    if not strategy_norm:
         raise ConfigError("analysis.strategy must be a non-empty string")
     if not isinstance(allow_secondary, bool):
         raise ConfigError("analysis.allow_secondary_assignments must be a boolean")
     if not isinstance(allow_multiple_primary, bool):
         raise ConfigError("analysis.allow_multiple_primary_assignments must be a boolean")
 
-    llm_guidance = LlmGuidanceConfig()
     if llm_guidance_raw is None:
-        llm_guidance = LlmGuidanceConfig()
+        llm_guidance = _DEFAULT_LLM_GUIDANCE
     elif isinstance(llm_guidance_raw, dict):
         def _get_bool(key: str, default: bool) -> bool:
             v = llm_guidance_raw.get(key, default)
@@ -576,46 +719,47 @@ def _parse_analysis(value: Any) -> AnalysisConfig:
                 return None
             if not isinstance(v, str):
                 raise ConfigError(f"analysis.llm_guidance.{key} must be a string or null")
-            text = " ".join(v.split()).strip()
+            text = " ".join(v.split())
             return text or None
 
         llm_guidance = LlmGuidanceConfig(
-            explain_assignments=_get_bool("explain_assignments", LlmGuidanceConfig.explain_assignments),
+            explain_assignments=_get_bool("explain_assignments", _DEFAULT_LLM_GUIDANCE.explain_assignments),
             require_textual_evidence=_get_bool(
                 "require_textual_evidence",
-                LlmGuidanceConfig.require_textual_evidence,
+                _DEFAULT_LLM_GUIDANCE.require_textual_evidence,
             ),
             list_rejected_assignments=_get_bool(
                 "list_rejected_assignments",
-                LlmGuidanceConfig.list_rejected_assignments,
+                _DEFAULT_LLM_GUIDANCE.list_rejected_assignments,
             ),
             default_to_conservative_orientation=_get_bool(
                 "default_to_conservative_orientation",
-                LlmGuidanceConfig.default_to_conservative_orientation,
+                _DEFAULT_LLM_GUIDANCE.default_to_conservative_orientation,
             ),
             reasoning_language=_get_optional_str(
                 "reasoning_language",
-                LlmGuidanceConfig.reasoning_language,
+                _DEFAULT_LLM_GUIDANCE.reasoning_language,
             ),
         )
     else:
         raise ConfigError("analysis.llm_guidance must be a mapping if provided")
 
-    strategy_norm = strategy.strip().lower()
-    if strategy_norm not in {"segment", "topic"}:
+    if strategy_norm not in _ANALYSIS_STRATEGIES:
         raise ConfigError("analysis.strategy must be either 'segment' or 'topic'")
 
     rules: list[str] = []
     if rules_raw is None:
         rules = []
     elif isinstance(rules_raw, str):
-        if rules_raw.strip():
-            rules = [rules_raw.strip()]
+        rule = rules_raw.strip()
+        if rule:
+            rules = [rule]
     elif isinstance(rules_raw, list):
         for idx, item in enumerate(rules_raw, start=1):
             if not isinstance(item, str):
                 raise ConfigError(f"analysis.rules[{idx}] must be a string")
-            text = " ".join(item.split()).strip()
+            # split() already drops leading/trailing whitespace.
+            text = " ".join(item.split())
             if text:
                 rules.append(text)
     else:
@@ -12,8 +12,11 @@ The project uses MD5 hashes only for change detection of intermediate work files
 It is not used for cryptographic security.
 """
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import hashlib
+import os
 
 
 def md5_file(path: Path) -> str:
@@ -34,11 +37,33 @@ def md5_file(path: Path) -> str:
     except TypeError:
         hasher = hashlib.md5()
 
+    # file_digest() runs the read/update loop in C, straight from the file
+    # descriptor where possible.
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            hasher.update(chunk)
+        return hashlib.file_digest(handle, lambda: hasher).hexdigest()
 
-    return hasher.hexdigest()
+
+def md5_files(paths: Iterable[Path]) -> dict[Path, str]:
+    """Compute MD5 hashes for several files concurrently.
+
+    hashlib releases the GIL while reading and hashing, so a small thread pool
+    overlaps the I/O and hashing of different files.
+
+    Args:
+        paths:
+            File paths.
+
+    Returns:
+        Mapping of each path to its lowercase hex MD5 digest.
+    """
+
+    unique = list(dict.fromkeys(paths))
+    if len(unique) <= 1:
+        return {p: md5_file(p) for p in unique}
+
+    workers = min(8, os.cpu_count() or 1, len(unique))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(unique, pool.map(md5_file, unique)))
 
 
 def md5_bytes(data: bytes) -> str:
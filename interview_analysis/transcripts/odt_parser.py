@@ -49,24 +49,25 @@ class OdtTranscriptParser:
                             pass
                 return str(node)
 
-            blocks: list[str] = []
-
             # Using XPath is more robust than `get_paragraphs()` for documents
             # converted from DOCX or containing formatted content (lists, tables,
             # frames, etc.).
-            nodes: list[object] = []
+            # An empty result is final: `get_paragraphs()` only finds a subset
+            # of these nodes, so it is just the fallback if the query fails.
+            nodes: list[object]
             try:
                 nodes = list(body.xpath(".//text:p | .//text:h"))
             except Exception:
-                nodes = []
-
-            if nodes:
-                for n in nodes:
-                    blocks.append(_node_text(n))
-            else:
                 # Fallback for unexpected odfdo versions/doc structures.
-                for p in body.get_paragraphs():
-                    blocks.append(_node_text(p))
+                nodes = list(body.get_paragraphs())
+
+            # odfdo elements all provide `inner_text`, so read it directly and
+            # only probe the other accessors per node if that fails.
+            blocks: list[str]
+            try:
+                blocks = [n.inner_text for n in nodes]  # type: ignore[attr-defined]
+            except Exception:  # noqa: BLE001
+                blocks = [_node_text(n) for n in nodes]
 
             return parse_statement_blocks(blocks)
         except Exception as exc:  # noqa: BLE001
@@ -22,7 +22,7 @@ The output is compatible with the segmentation step.
 """
 
 import re
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 
 # Accept common Markdown prefixes (block quotes, bullet points, numbered lists)
@@ -32,12 +32,16 @@ _LABEL_RE = re.compile(
 )
 
 # Allow the metadata marker to be formatted like normal statements in Markdown
-# (e.g., block quotes or list items) and ignore case.
+# (e.g., block quotes or list items). The key accepts either case explicitly;
+# it is lowercased when the record is built.
 _META_RE = re.compile(
-    r"^\s*(?:>\s*)*(?:[-+*]\s+|\d+[\.)]\s+)?(?P<key>[A-Za-z][A-Za-z0-9_\-]{0,63})\s*=\s*(?P<value>.*?)\s*$",
-    re.IGNORECASE,
+    r"^\s*(?:>\s*)*(?:[-+*]\s+|\d+[\.)]\s+)?(?P<key>[A-Za-z][A-Za-z0-9_\-]{0,63})\s*=\s*(?P<value>.*?)\s*$"
 )
 
+# Both of the above in one pass. Metadata is tried first, so a block matching
+# both is still treated as metadata.
+_BLOCK_RE = re.compile(rf"(?:{_META_RE.pattern})|(?:{_LABEL_RE.pattern})")
+
 
 def parse_statement_blocks(blocks: Iterable[str]) -> list[dict[str, Any]]:
     """Parse extracted blocks into statement paragraph records.
@@ -52,47 +56,68 @@ def parse_statement_blocks(blocks: Iterable[str]) -> list[dict[str, Any]]:
         Metadata blocks are included with `source_index = 0`.
     """
 
-    paragraphs: list[dict[str, Any]] = []
+    return list(iter_statement_blocks(blocks))
+
+
+def iter_statement_blocks(blocks: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Lazily parse extracted blocks into statement paragraph records.
+
+    Streaming variant of `parse_statement_blocks()` with the same records in the
+    same order. A statement is yielded once it is complete, i.e. when the next
+    statement starts or the input ends, so only the open statement is buffered.
+
+    Args:
+        blocks:
+            Iterable of raw text blocks/paragraphs.
+
+    Yields:
+        Paragraph records, see `parse_statement_blocks()`.
+    """
+
     statement_index = 0
+    # Text parts of the open statement. Continuations are collected here and
+    # joined once, so long multi-block statements are not re-copied per block.
+    parts: list[str] = []
+    # Metadata seen while a statement is open. It follows that statement in the
+    # output, even when continuation blocks come after the metadata.
+    pending_meta: list[dict[str, Any]] = []
+    block_match = _BLOCK_RE.match
 
     for block in blocks:
         cleaned = " ".join(str(block).split())
         if not cleaned:
             continue
 
-        meta = _META_RE.match(cleaned)
-        if meta:
-            key = (meta.group("key") or "").strip().lower()
-            value = (meta.group("value") or "").strip()
-            paragraphs.append(
-                {
-                    "source_index": 0,
-                    "text": f"{key} = {value}",
-                }
-            )
-            continue
-
-        if _LABEL_RE.match(cleaned):
+        match = block_match(cleaned)
+        if match is not None:
+            # Groups 1 and 2 are `key` and `value` from `_META_RE`. Both are
+            # None when the label alternative matched; the regex already trims
+            # the whitespace around them.
+            key, value = match.group(1, 2)
+            if key is not None:
+                record = {"source_index": 0, "text": f"{key.lower()} = {value}"}
+                if parts:
+                    pending_meta.append(record)
+                else:
+                    yield record
+                continue
+
+            # Speaker statement: complete the previous one, start a new one.
+            if parts:
+                yield {"source_index": statement_index, "text": " ".join(parts)}
+                yield from pending_meta
+                pending_meta = []
             statement_index += 1
-            paragraphs.append({"source_index": statement_index, "text": cleaned})
+            parts = [cleaned]
             continue
 
         # Ignore any unlabeled blocks before the first statement.
-        if statement_index == 0:
-            continue
-
-        # Continuation: append to the last *statement* (skip metadata records).
-        prev_statement: dict[str, Any] | None = None
-        for rec in reversed(paragraphs):
-            if int(rec.get("source_index") or 0) != 0:
-                prev_statement = rec
-                break
-
-        if prev_statement is None:
-            # Defensive: should not happen if statement_index > 0.
+        if not parts:
             continue
 
-        prev_text = str(prev_statement.get("text") or "")
-        prev_statement["text"] = (prev_text + " " + cleaned).strip()
+        # Continuation. All parts are already stripped and non-empty.
+        parts.append(cleaned)
 
-    return paragraphs
+    if parts:
+        yield {"source_index": statement_index, "text": " ".join(parts)}
+        yield from pending_meta
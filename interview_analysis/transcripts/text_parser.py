@@ -17,12 +17,15 @@ Rules:
 The parser only performs raw parsing and text normalization.
 """
 
+import re
 from pathlib import Path
 from typing import Any
 
 from interview_analysis.transcripts.base import ParserError, TranscriptParser
 from interview_analysis.transcripts.statement_blocks import parse_statement_blocks
 
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
 
 class TextTranscriptParser:
     """Parse .txt and .md transcripts into statement records."""
@@ -31,6 +34,8 @@ class TextTranscriptParser:
         return path.suffix.lower() in {".txt", ".md"}
 
     def read_paragraphs(self, path: Path) -> list[dict[str, Any]]:
+        # read_text() opens in universal-newline mode, so CRLF and lone CR line
+        # endings already arrive as "\n".
         try:
             raw = path.read_text(encoding="utf-8")
         except Exception as exc:  # noqa: BLE001
@@ -39,26 +44,8 @@ class TextTranscriptParser:
         # Some editors export UTF-8 text with an initial BOM (U+FEFF). If left
         # in place, it can break speaker-label and metadata detection on the
         # first line.
-        raw = raw.lstrip("\ufeff")
-        text = raw.replace("\r\n", "\n").replace("\r", "\n")
-
-        blocks: list[tuple[int, str]] = []
-        current: list[str] = []
-        start_line: int | None = None
-
-        for idx, line in enumerate(text.split("\n"), start=1):
-            if not line.strip():
-                if current:
-                    blocks.append((start_line or idx, "\n".join(current).strip()))
-                    current = []
-                    start_line = None
-                continue
-
-            if start_line is None:
-                start_line = idx
-            current.append(line)
-
-        if current:
-            blocks.append((start_line or 1, "\n".join(current).strip()))
+        text = raw.lstrip("\ufeff")
 
-        return parse_statement_blocks(block for _, block in blocks)
+        # Any run of blank (whitespace-only) lines separates two blocks.
+        blocks = map(str.strip, _BLANK_LINES_RE.split(text))
+        return parse_statement_blocks(block for block in blocks if block)
@@ -16,7 +16,25 @@ from typing import Any
 
 import yaml
 
-from interview_analysis.config import ConfigError
+from interview_analysis.config import ConfigError, _YamlLoader
+
+
+class _NotAMappingError(Exception):
+    """Raised by `_MappingLoader` when the document root is not a mapping."""
+
+
+class _MappingLoader(_YamlLoader):  # type: ignore[misc, valid-type]
+    """Safe loader that rejects non-mapping documents before constructing them.
+
+    The root node type is known once the document is composed, so a list or
+    scalar document fails without first being turned into Python objects.
+    """
+
+    def get_single_data(self) -> Any:
+        node = self.get_single_node()
+        if not isinstance(node, yaml.MappingNode):
+            raise _NotAMappingError
+        return self.construct_document(node)
 
 
 def read_yaml_mapping(path: Path) -> dict[str, Any]:
@@ -35,11 +53,10 @@ def read_yaml_mapping(path: Path) -> dict[str, Any]:
     """
 
     try:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        # Let the parser read and decode the file itself; no full str copy.
+        with path.open("rb") as handle:
+            return yaml.load(handle, Loader=_MappingLoader)
+    except _NotAMappingError:
+        raise ConfigError(f"YAML file must contain a mapping: {path}") from None
     except Exception as exc:  # noqa: BLE001
         raise ConfigError(f"Failed to read YAML file '{path}': {exc}") from exc
-
-    if not isinstance(raw, dict):
-        raise ConfigError(f"YAML file must contain a mapping: {path}")
-
-    return raw